@@ -43,10 +43,16 @@ def read_problem_file(filename):
     
     return nodes, edges, origin, destinations
 
-def breadth_first_search(nodes, edges, origin, destinations):
+def breadth_first_search(nodes, edges, origin, destinations, index=None):
+    nodes_created = 1 
+    if index is not None:
+        # Drop unreachable destinations, answer at once if none are left
+        destinations = index.prune(origin, destinations)
+        if not destinations:
+            return None, None, nodes_created
+
     frontier = deque([(origin, [origin])])
     explored = set()
-    nodes_created = 1 
     
     while frontier:
         current, path = frontier.popleft()
@@ -1,5 +1,5 @@
-import heapq
 import sys
+from itertools import chain
 
 def read_problem_file(filename):
     """Read the problem file and parse the nodes, edges, origin, and destinations."""
@@ -44,14 +44,31 @@ def read_problem_file(filename):
     
     return nodes, edges, origin, destinations
 
-def uniform_cost_search(nodes, edges, origin, destinations):
+def uniform_cost_search(nodes, edges, origin, destinations, tie_break='node', index=None, queue=None):
+    """Expands nodes by path cost; `tie_break` orders equal-cost entries (see priority_queue).
+    An optional reachability `index` answers queries with no reachable destination up front.
+    `queue` is a factory returning an empty frontier, to reuse one choice across many queries.
+    The Dial / radix bucket queues are only picked for integer costs with tie_break 'fifo' or
+    'lifo'; the default 'node' keeps the binary heap, which is faster for it in CPython."""
+    nodes_created = 1 
+    if index is not None:
+        destinations = index.prune(origin, destinations)
+        if not destinations:
+            return None, None, nodes_created
 
-    frontier = [(0, origin, [origin])]
+    if queue is not None:
+        frontier = queue()
+    else:
+        # Imported here so reading a problem file does not load the queues
+        from bucket_queue import make_queue
+        costs = chain.from_iterable(map(dict.values, edges.values())) if isinstance(edges, dict) else None
+        frontier = make_queue(costs, tie_break)
+    frontier.push(0, origin, [origin])
     explored = set()
-    nodes_created = 1 
     
     while frontier:
-        cost, current, path = heapq.heappop(frontier)
+        cost, path = frontier.pop()
+        current = path[-1]
 
         if current in destinations:
             return path, current, nodes_created
@@ -68,7 +85,7 @@ def uniform_cost_search(nodes, edges, origin, destinations):
             if neighbor not in explored:
                 new_cost = cost + edge_cost
                 new_path = path + [neighbor]
-                heapq.heappush(frontier, (new_cost, neighbor, new_path))
+                frontier.push(new_cost, neighbor, new_path)
                 nodes_created += 1
 
     return None, None, nodes_created
@@ -1,6 +1,7 @@
-import heapq
 from collections import deque
 
+from priority_queue import PriorityQueue
+
 graph = {
     'A': [('B', 1), ('C', 4)],
     'B': [('A', 1), ('C', 2), ('D', 5)],
@@ -37,34 +38,39 @@ def bfs(graph, start, goal):
 def heuristic(node, goal):
     return 1
 
-def gbfs(graph, start, goal):
-    priority_queue = [(heuristic(start, goal), start, [start])]
+def gbfs(graph, start, goal, tie_break='node'):
+    priority_queue = PriorityQueue(tie_break)
+    priority_queue.push(heuristic(start, goal), start, [start], heuristic(start, goal))
     while priority_queue:
-        _, vertex, path = heapq.heappop(priority_queue)
+        _, path = priority_queue.pop()
+        vertex = path[-1]
         for neighbor, _ in graph[vertex]:
             if neighbor not in path:
                 if neighbor == goal:
                     return path + [neighbor]
                 else:
-                    heapq.heappush(priority_queue, (heuristic(neighbor, goal), neighbor, path + [neighbor]))
+                    priority_queue.push(heuristic(neighbor, goal), neighbor, path + [neighbor], heuristic(neighbor, goal))
     return None
 
-def a_star(graph, start, goal):
-    open_list = [(heuristic(start, goal), 0, start, [start])]
+def a_star(graph, start, goal, tie_break='node'):
+    open_list = PriorityQueue(tie_break)
+    open_list.push(heuristic(start, goal), start, (0, [start]), heuristic(start, goal))
     while open_list:
-        _, cost_so_far, vertex, path = heapq.heappop(open_list)
+        _, (cost_so_far, path) = open_list.pop()
+        vertex = path[-1]
         for neighbor, edge_cost in graph[vertex]:
             if neighbor not in path:
                 new_cost = cost_so_far + edge_cost
                 if neighbor == goal:
                     return path + [neighbor]
                 else:
-                    heapq.heappush(open_list, (new_cost + heuristic(neighbor, goal), new_cost, neighbor, path + [neighbor]))
+                    open_list.push(new_cost + heuristic(neighbor, goal), neighbor, (new_cost, path + [neighbor]), heuristic(neighbor, goal))
     return None
 
 import random
 
-def custom_search_1(graph, start, goal):
+def custom_search_1(graph, start, goal, seed=None):
+    rng = random.Random(seed)
     current = start
     path = [start]
     visited = set([start])
@@ -77,18 +83,24 @@ def custom_search_1(graph, start, goal):
             else:
                 return None
         else:
-            next_node = random.choice(neighbors)
+            next_node = rng.choice(neighbors)
             path.append(next_node)
             visited.add(next_node)
             current = next_node
     return path
 
-def custom_search_2(graph, start, goal):
+def custom_search_2(graph, start, goal, tie_break='node'):
+    """Dijkstra over (neighbor, cost) lists; integer costs with tie_break 'fifo' or 'lifo'
+    use a bucket queue (see bucket_queue.make_queue), any other tie-break the binary heap."""
+    from bucket_queue import make_queue # Imported on use, as in CUS1.uniform_cost_search
+
     distances = {node: float('inf') for node in graph}
     distances[start] = 0
-    priority_queue = [(0, start, [start])]
+    priority_queue = make_queue((cost for neighbors in graph.values() for _, cost in neighbors), tie_break)
+    priority_queue.push(0, start, [start])
     while priority_queue:
-        current_distance, current_node, current_path = heapq.heappop(priority_queue)
+        current_distance, current_path = priority_queue.pop()
+        current_node = current_path[-1]
         if current_node == goal:
             return current_path
         if current_distance > distances[current_node]:
@@ -97,15 +109,16 @@ def custom_search_2(graph, start, goal):
             distance = current_distance + edge_cost
             if distance < distances[neighbor]:
                 distances[neighbor] = distance
-                heapq.heappush(priority_queue, (distance, neighbor, current_path + [neighbor]))
+                priority_queue.push(distance, neighbor, current_path + [neighbor])
     return None
 
 
-
-start = 'A'
-print("DFS:", dfs(graph, start, goal))
-print("BFS:", bfs(graph, start, goal))
-print("GBFS:", gbfs(graph, start, goal))
-print("A*:", a_star(graph, start, goal))
-print("Custom Search 1:", custom_search_1(graph, start, goal))
-print("Custom Search 2:", custom_search_2(graph, start, goal))    
\ No newline at end of file
+if __name__ == "__main__":
+    # Demo on the sample graph, only when run as a script
+    start = 'A'
+    print("DFS:", dfs(graph, start, goal))
+    print("BFS:", bfs(graph, start, goal))
+    print("GBFS:", gbfs(graph, start, goal))
+    print("A*:", a_star(graph, start, goal))
+    print("Custom Search 1:", custom_search_1(graph, start, goal))
+    print("Custom Search 2:", custom_search_2(graph, start, goal))
@@ -1,4 +1,4 @@
-import heapq
+from priority_queue import PriorityQueue
 
 
 def read_graph(file_path):
@@ -77,43 +77,54 @@ def heuristic(a, b, nodes):
     return abs(x1 - x2) + abs(y1 - y2)
 
 
-def gbfs(nodes, edges, origin, destination):
-    heap = [(heuristic(origin, destination, nodes), origin, [origin])]
+def gbfs(nodes, edges, origin, destination, tie_break='node', return_count=False):
+    heap = PriorityQueue(tie_break)
+    h = heuristic(origin, destination, nodes)
+    heap.push(h, origin, [origin], h)
     visited = set()
+    nodes_created = 1
 
     while heap:
-        _, node, path = heapq.heappop(heap)
+        _, path = heap.pop()
+        node = path[-1]
         if node == destination:
-            return path
+            return (path, nodes_created) if return_count else path
         if node not in visited:
             visited.add(node)
             for neighbor in sorted([end for start, end in edges if start == node]):
-                heapq.heappush(heap, (heuristic(neighbor, destination, nodes), neighbor, path + [neighbor]))
+                h = heuristic(neighbor, destination, nodes)
+                heap.push(h, neighbor, path + [neighbor], h)
+                nodes_created += 1
 
-    return None
+    return (None, nodes_created) if return_count else None
 
 
-def astar(nodes, edges, origin, destination):
-    open_set = [(0 + heuristic(origin, destination, nodes), origin, [origin], 0)]
+def astar(nodes, edges, origin, destination, tie_break='node'):
+    open_set = PriorityQueue(tie_break)
+    h = heuristic(origin, destination, nodes)
+    open_set.push(0 + h, origin, ([origin], 0), h)
     closed_set = set()
 
     while open_set:
-        _, node, path, cost = heapq.heappop(open_set)
+        _, (path, cost) = open_set.pop()
+        node = path[-1]
         if node == destination:
             return path
         if node not in closed_set:
             closed_set.add(node)
             for neighbor in sorted([end for start, end in edges if start == node]):
                 new_cost = cost + edges[(node, neighbor)]
-                heapq.heappush(open_set, (new_cost + heuristic(neighbor, destination, nodes), neighbor, path + [neighbor], new_cost))
+                h = heuristic(neighbor, destination, nodes)
+                open_set.push(new_cost + h, neighbor, (path + [neighbor], new_cost), h)
 
     return None
 
 
-def custom_uninformed_search(nodes, edges, origin, destination):
+def custom_uninformed_search(nodes, edges, origin, destination, seed=None):
     stack = [(origin, [origin])]
     visited = set()
     import random
+    rng = random.Random(seed)
     while stack:
         node, path = stack.pop()
         if node == destination:
@@ -121,38 +132,44 @@ def custom_uninformed_search(nodes, edges, origin, destination):
         if node not in visited:
             visited.add(node)
             neighbors = [end for start, end in edges if start == node]
-            random.shuffle(neighbors)
-            for neighbor in sorted(neighbors):
+            rng.shuffle(neighbors)
+            for neighbor in neighbors:
                 stack.append((neighbor, path + [neighbor]))
 
     return None
 
 
-def custom_informed_search(nodes, edges, origin, destination):
-    heap = [(heuristic(origin, destination, nodes), origin, [origin], 0)]
+def custom_informed_search(nodes, edges, origin, destination, tie_break='node', return_count=False):
+    heap = PriorityQueue(tie_break)
+    h = heuristic(origin, destination, nodes)
+    heap.push(h, origin, ([origin], 0), h)
     visited = set()
+    nodes_created = 1
     while heap:
-        _, node, path, cost = heapq.heappop(heap)
+        _, (path, cost) = heap.pop()
+        node = path[-1]
         if node == destination:
-            return path
+            return (path, nodes_created) if return_count else path
         if node not in visited:
             visited.add(node)
             for neighbor in sorted([end for start, end in edges if start == node]):
                 new_cost = cost + edges[(node, neighbor)]
                 new_heuristic = heuristic(neighbor, destination, nodes)
-                heapq.heappush(heap, (new_heuristic + new_cost * 0.5, neighbor, path + [neighbor], new_cost))
+                heap.push(new_heuristic + new_cost * 0.5, neighbor, (path + [neighbor], new_cost), new_heuristic)
+                nodes_created += 1
 
-    return None
+    return (None, nodes_created) if return_count else None
 
 
 def main():
     import sys
-    if len(sys.argv)!= 3:
-        print('Usage: python search.py <filename> <method>')
+    if len(sys.argv) not in (3, 4):
+        print('Usage: python search.py <filename> <method> [width]')
         return
 
     file_path = sys.argv[1]
     method = sys.argv[2]
+    width = int(sys.argv[3]) if len(sys.argv) == 4 else None
 
     nodes, edges, origin, destinations = read_graph(file_path)
 
@@ -169,6 +186,11 @@ def main():
             path = custom_uninformed_search(nodes, edges, origin, destination)
         elif method == 'CUS2':
             path = custom_informed_search(nodes, edges, origin, destination)
+        elif method in ('BEAM', 'BGBFS'):
+            # Bounded-memory greedy modes, the width caps the frontier size
+            import bounded_search
+            search = bounded_search.beam_search if method == 'BEAM' else bounded_search.bounded_gbfs
+            path = search(nodes, edges, origin, destination, width or bounded_search.DEFAULT_WIDTH)
         else:
             print('Invalid method')
             return
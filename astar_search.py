@@ -1,9 +1,9 @@
 import sys #  system-specific functions
 import math #  math functions.
-import heapq #  heap queue algorithm, efficient data structures for finding element
-import re # regular expressions
 import time # time-related functions
 
+from priority_queue import PriorityQueue # frontier shared by the heap based strategies
+
 # --- Data Structures ---
 
 class Node:
@@ -47,6 +47,10 @@ class Graph:
     def get_node(self, node_id):
         return self.nodes.get(node_id)
 
+def graph_edges(graph):
+    """Returns the graph as a {node_id: {neighbor_id: cost}} adjacency map."""
+    return {node_id: node.neighbors for node_id, node in graph.nodes.items()}
+
 # --- Heuristic Function ---
 
 def euclidean_distance(node1_coords, node2_coords):
@@ -76,21 +80,31 @@ def heuristic(graph, current_node_id):
 
 # --- A* Search Algorithm ---
 
-def a_star_search(graph):
-    """Performs A* search on the graph."""
+def a_star_search(graph, tie_break='node', index=None):
+    """Performs A* search on the graph.
+       `tie_break` orders entries with equal f_cost, see priority_queue.
+       `index` is an optional ReachabilityIndex built from graph_edges(graph).
+    """
     start_node_id = graph.origin_id
     destination_ids = graph.destination_ids
 
-    # Priority Queue (Frontier): Stores tuples (f_cost, node_id, g_cost, path, timestamp)
-    entry_count = 0 
-    frontier = [(heuristic(graph, start_node_id), start_node_id, 0, [start_node_id], entry_count)]
-    entry_count += 1
+    # Reachability precheck: no reachable destination means no search
+    if index is not None:
+        destination_ids = index.prune(start_node_id, destination_ids)
+        if not destination_ids:
+            return None, 1
+
+    # Priority Queue (Frontier): f_cost keyed entries holding (g_cost, path)
+    start_h = heuristic(graph, start_node_id)
+    frontier = PriorityQueue(tie_break)
+    frontier.push(start_h, start_node_id, (0, [start_node_id]), start_h)
     # Explored set: Stores {node_id: g_cost} to keep track of the lowest cost found so far to reach a node
     explored = {}
     nodes_created = 1 #
 
     while frontier:
-        f_cost_est, current_node_id, g_cost, path, _ = heapq.heappop(frontier)
+        f_cost_est, (g_cost, path) = frontier.pop()
+        current_node_id = path[-1]
 
         # Goal Check
         if current_node_id in destination_ids:
@@ -122,8 +136,7 @@ def a_star_search(graph):
             nodes_created += 1
 
             # Add neighbor to the frontier
-            heapq.heappush(frontier, (f_cost, neighbor_id, new_g_cost, new_path, entry_count))
-            entry_count += 1
+            frontier.push(f_cost, neighbor_id, (new_g_cost, new_path), h_cost)
 
     return None, nodes_created # No path found
 
@@ -131,6 +144,7 @@ def a_star_search(graph):
 
 def parse_input_file(filename):
     """Parses the problem definition file."""
+    import re # regular expressions, imported here so search.py's AS path skips it
     graph = Graph()
     section = None
 
@@ -0,0 +1,288 @@
+import sys
+
+from Nodes_GBFS import heuristic, gbfs
+from graph_utils import build_path
+
+DEFAULT_WIDTH = 100
+
+# --- Data Structures ---
+
+class MinMaxHeap:
+    """Double-ended priority queue: O(log n) push, pop_min and pop_max.
+
+    Even levels of the implicit tree are ordered as a min-heap and odd levels
+    as a max-heap, so both the best and the worst entry sit within the top
+    three slots. Entries are compared directly, keep them small tuples.
+    """
+    def __init__(self):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def push(self, item):
+        self.heap.append(item)
+        self._bubble_up(len(self.heap) - 1)
+
+    def peek_min(self):
+        return self.heap[0]
+
+    def peek_max(self):
+        return self.heap[self._max_index()]
+
+    def pop_min(self):
+        return self._pop_at(0)
+
+    def pop_max(self):
+        return self._pop_at(self._max_index())
+
+    def _max_index(self):
+        heap = self.heap
+        if len(heap) == 1:
+            return 0
+        if len(heap) == 2 or heap[1] >= heap[2]:
+            return 1
+        return 2
+
+    def _pop_at(self, index):
+        heap = self.heap
+        last = heap.pop()
+        if index == len(heap):
+            return last
+        item = heap[index]
+        heap[index] = last
+        self._trickle_down(index)
+        return item
+
+    @staticmethod
+    def _is_min_level(index):
+        return (index + 1).bit_length() % 2 == 1
+
+    def _bubble_up(self, index):
+        heap = self.heap
+        if index == 0:
+            return
+        parent = (index - 1) // 2
+        if self._is_min_level(index):
+            if heap[index] > heap[parent]:
+                heap[index], heap[parent] = heap[parent], heap[index]
+                self._bubble_up_grand(parent, max_level=True)
+            else:
+                self._bubble_up_grand(index, max_level=False)
+        else:
+            if heap[index] < heap[parent]:
+                heap[index], heap[parent] = heap[parent], heap[index]
+                self._bubble_up_grand(parent, max_level=False)
+            else:
+                self._bubble_up_grand(index, max_level=True)
+
+    def _bubble_up_grand(self, index, max_level):
+        heap = self.heap
+        while index > 2:
+            grandparent = ((index - 1) // 2 - 1) // 2
+            if (heap[index] > heap[grandparent]) if max_level else (heap[index] < heap[grandparent]):
+                heap[index], heap[grandparent] = heap[grandparent], heap[index]
+                index = grandparent
+            else:
+                break
+
+    def _trickle_down(self, index):
+        heap = self.heap
+        size = len(heap)
+        max_level = not self._is_min_level(index)
+
+        while True:
+            first_child = 2 * index + 1
+            if first_child >= size:
+                return
+
+            # Best (smallest on min levels, largest on max levels) child or grandchild
+            candidates = [first_child, first_child + 1] + list(range(4 * index + 3, 4 * index + 7))
+            best = first_child
+            for candidate in candidates[1:]:
+                if candidate >= size:
+                    continue
+                if (heap[candidate] > heap[best]) if max_level else (heap[candidate] < heap[best]):
+                    best = candidate
+
+            better = (heap[best] > heap[index]) if max_level else (heap[best] < heap[index])
+            if not better:
+                return
+            heap[index], heap[best] = heap[best], heap[index]
+
+            if best <= first_child + 1:
+                return # Direct child, the heap order is restored
+
+            parent = (best - 1) // 2
+            if (heap[best] < heap[parent]) if max_level else (heap[best] > heap[parent]):
+                heap[best], heap[parent] = heap[parent], heap[best]
+            index = best
+
+# --- Helpers ---
+
+def build_adjacency(edges):
+    """Turns the {(start, end): cost} edge map into sorted neighbor lists."""
+    adjacency = {}
+    for start, end in edges:
+        adjacency.setdefault(start, []).append(end)
+    for neighbors in adjacency.values():
+        neighbors.sort()
+    return adjacency
+
+# --- Bounded greedy searches ---
+
+def beam_search(nodes, edges, origin, destination, width=DEFAULT_WIDTH, adjacency=None, return_count=False):
+    """
+    Greedy beam search: expands the frontier level by level and keeps only the
+    `width` successors with the lowest heuristic value.
+
+    Returns:
+        list | None: The path found, or None if the beam ran dry. With
+        `return_count`, a (path, nodes_created) tuple instead.
+    """
+    if adjacency is None:
+        adjacency = build_adjacency(edges)
+    if origin == destination:
+        return ([origin], 1) if return_count else [origin]
+
+    parents = {origin: None} # Only nodes that made it into a beam
+    beam = [origin]
+    nodes_created = 1
+
+    while beam:
+        candidates = MinMaxHeap()
+        level = {} # Successors currently held in candidates -> their parent
+        for node in beam:
+            for neighbor in adjacency.get(node, ()):
+                if neighbor in parents or neighbor in level:
+                    continue
+                nodes_created += 1
+                if neighbor == destination:
+                    parents[neighbor] = node
+                    path = build_path(parents, neighbor)
+                    return (path, nodes_created) if return_count else path
+                level[neighbor] = node
+                candidates.push((heuristic(neighbor, destination, nodes), neighbor))
+                if len(candidates) > width:
+                    # Drop the worst successor of this level, a later level may reach it again
+                    _, dropped = candidates.pop_max()
+                    del level[dropped]
+
+        parents.update(level)
+        beam = [node for _, node in candidates.heap]
+
+    return (None, nodes_created) if return_count else None
+
+def bounded_gbfs(nodes, edges, origin, destination, width=DEFAULT_WIDTH, adjacency=None, return_count=False):
+    """
+    Greedy best-first search whose frontier never holds more than `width`
+    entries; when it overflows the entry with the highest heuristic is evicted.
+
+    Returns:
+        list | None: The path found, or None if the frontier ran dry. With
+        `return_count`, a (path, nodes_created) tuple instead.
+    """
+    if adjacency is None:
+        adjacency = build_adjacency(edges)
+
+    parents = {origin: None} # Every node currently in the frontier or already expanded
+    frontier = MinMaxHeap()
+    frontier.push((heuristic(origin, destination, nodes), origin))
+    nodes_created = 1
+
+    while frontier:
+        _, node = frontier.pop_min()
+        if node == destination:
+            path = build_path(parents, node)
+            return (path, nodes_created) if return_count else path
+
+        for neighbor in adjacency.get(node, ()):
+            if neighbor in parents:
+                continue
+            parents[neighbor] = node
+            frontier.push((heuristic(neighbor, destination, nodes), neighbor))
+            nodes_created += 1
+            if len(frontier) > width:
+                # Forget the evicted node so a later expansion can rediscover it
+                _, evicted = frontier.pop_max()
+                del parents[evicted]
+
+    return (None, nodes_created) if return_count else None
+
+# --- Benchmark ---
+
+def random_geometric_graph(size, seed=0, radius=None):
+    """Random nodes on a plane, each connected to its nearby nodes in both directions."""
+    import math
+    import random
+    rng = random.Random(seed)
+    extent = int(math.sqrt(size) * 10)
+    nodes = {node_id: (rng.randint(0, extent), rng.randint(0, extent)) for node_id in range(1, size + 1)}
+    radius = radius or 18
+    cells = {}
+    for node_id, (x, y) in nodes.items():
+        cells.setdefault((x // radius, y // radius), []).append(node_id)
+
+    edges = {}
+    for node_id, (x, y) in nodes.items():
+        cx, cy = x // radius, y // radius
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for other in cells.get((cx + dx, cy + dy), ()):
+                    if other == node_id:
+                        continue
+                    ox, oy = nodes[other]
+                    dist = abs(x - ox) + abs(y - oy)
+                    if dist <= radius:
+                        edges[(node_id, other)] = dist
+    return nodes, edges
+
+def path_cost(edges, path):
+    return sum(edges[(a, b)] for a, b in zip(path, path[1:]))
+
+def _measure(search, *args, **kwargs):
+    import time
+    import tracemalloc
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    path = search(*args, **kwargs)
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return path, elapsed, peak
+
+def benchmark(size=3000, widths=(4, 16, 64, 256), queries=5, seed=0):
+    """Compares frontier memory and path cost of the bounded modes with gbfs."""
+    import random
+    nodes, edges = random_geometric_graph(size, seed)
+    adjacency = build_adjacency(edges)
+    rng = random.Random(seed)
+    pairs = [tuple(rng.sample(sorted(nodes), 2)) for _ in range(queries)]
+    print(f"{len(nodes)} nodes, {len(edges)} edges, {queries} queries")
+
+    rows = [("GBFS", None, gbfs, {})]
+    for width in widths:
+        rows.append(("BEAM", width, beam_search, {"width": width, "adjacency": adjacency}))
+        rows.append(("BGBFS", width, bounded_gbfs, {"width": width, "adjacency": adjacency}))
+
+    for name, width, search, kwargs in rows:
+        found, cost, elapsed, peak = 0, 0, 0.0, 0
+        for origin, destination in pairs:
+            path, seconds, memory = _measure(search, nodes, edges, origin, destination, **kwargs)
+            elapsed += seconds
+            peak = max(peak, memory)
+            if path:
+                found += 1
+                cost += path_cost(edges, path)
+        label = name if width is None else f"{name}({width})"
+        print(f"{label:<12} found {found}/{queries}  total cost {cost:>7}  "
+              f"peak {peak / 1024:>8.1f} KiB  time {elapsed:.3f}s")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        benchmark(size=int(sys.argv[1]))
+    else:
+        benchmark()
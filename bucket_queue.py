@@ -0,0 +1,206 @@
+import sys
+import heapq
+from collections import deque
+
+from priority_queue import PriorityQueue
+
+DIAL_MAX_COST = 1024 # Above this the Dial bucket array gets sparse, use a radix heap
+
+# --- Monotone integer priority queues ---
+#
+# Both queues assume the uniform-cost pattern: priorities are non-negative
+# integers and never lower than the last popped priority. Entries with the
+# same priority are kept in a small heap ordered by the same (tie, sequence)
+# key as PriorityQueue, so the pop order is identical to the heap version.
+# Under 'fifo' and 'lifo' insertion order alone decides, so those buckets
+# are plain queues/stacks holding bare items and every operation is O(1).
+
+class DialQueue(PriorityQueue):
+    """Dial's algorithm: a circular array of max_cost + 1 buckets, one per priority."""
+    def __init__(self, max_cost, tie_break='node'):
+        super().__init__(tie_break)
+        self.buckets = [deque() if tie_break == 'fifo' else [] for _ in range(max_cost + 1)]
+        self.current = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __bool__(self):
+        return self.size > 0
+
+    def push(self, priority, node, item, h=0):
+        if not self.current <= priority <= self.current + len(self.buckets) - 1:
+            raise ValueError(f"Priority {priority} outside the monotone window starting at {self.current}")
+        bucket = self.buckets[priority % len(self.buckets)]
+        if self.tie_break in ('fifo', 'lifo'):
+            bucket.append(item)
+        else:
+            self.sequence += 1
+            heapq.heappush(bucket, self._tie_key(node, h) + (item,))
+        self.size += 1
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty priority queue")
+        buckets = self.buckets
+        while not buckets[self.current % len(buckets)]:
+            self.current += 1
+        bucket = buckets[self.current % len(buckets)]
+        self.size -= 1
+        if self.tie_break == 'fifo':
+            return self.current, bucket.popleft()
+        if self.tie_break == 'lifo':
+            return self.current, bucket.pop()
+        return self.current, heapq.heappop(bucket)[2]
+
+class RadixHeap(PriorityQueue):
+    """Radix heap: bucket i holds priorities whose highest bit differing from the
+    last popped priority is bit i - 1, so each entry moves down at most once per bit."""
+    def __init__(self, tie_break='node'):
+        super().__init__(tie_break)
+        self.buckets = [deque() if tie_break == 'fifo' else []] + [[] for _ in range(64)]
+        self.last = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __bool__(self):
+        return self.size > 0
+
+    def push(self, priority, node, item, h=0):
+        if priority < self.last:
+            raise ValueError(f"Priority {priority} is below the last popped priority {self.last}")
+        if self.tie_break in ('fifo', 'lifo'):
+            entry = item
+        else:
+            self.sequence += 1
+            entry = self._tie_key(node, h) + (item,)
+        self._place(priority, entry)
+        self.size += 1
+
+    def _place(self, priority, entry):
+        # Buckets are only refilled while empty, so they stay in insertion order
+        index = (priority ^ self.last).bit_length()
+        if index != 0:
+            self.buckets[index].append((priority, entry))
+        elif self.tie_break in ('fifo', 'lifo'):
+            self.buckets[0].append(entry)
+        else:
+            heapq.heappush(self.buckets[0], entry) # Bucket 0 is ordered by (tie, sequence)
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty priority queue")
+        buckets = self.buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            moved = buckets[index]
+            buckets[index] = []
+            self.last = min(priority for priority, _ in moved)
+            for priority, entry in moved:
+                self._place(priority, entry)
+        self.size -= 1
+        if self.tie_break == 'fifo':
+            return self.last, buckets[0].popleft()
+        if self.tie_break == 'lifo':
+            return self.last, buckets[0].pop()
+        return self.last, heapq.heappop(buckets[0])[2]
+
+# --- Queue selection ---
+
+def integer_max_cost(costs):
+    """Returns the largest cost if every cost is a non-negative integer, else None."""
+    costs = list(costs)
+    if not costs:
+        return 0
+    # map/set/min/max keep the whole scan in C, it runs once per search
+    if set(map(type, costs)) != {int} or min(costs) < 0:
+        return None
+    return max(costs)
+
+def make_queue(costs=None, tie_break='node', max_cost=None):
+    """
+    Picks the frontier for a uniform-cost search from its edge costs.
+
+    With integer costs and a 'fifo' or 'lifo' tie-break this is Dial buckets
+    for small costs and a radix heap for wider ones. Everything else gets the
+    binary heap PriorityQueue: with 'node' or 'low_h' each bucket needs its own
+    heap, and measured in CPython that is slower than one C-level heapq.
+
+    Scanning `costs` is O(E); when the same graph is searched repeatedly pass
+    `max_cost = integer_max_cost(costs)` once instead.
+    """
+    if tie_break not in ('fifo', 'lifo'):
+        return PriorityQueue(tie_break)
+    if max_cost is None and costs is not None:
+        max_cost = integer_max_cost(costs)
+    if max_cost is None:
+        return PriorityQueue(tie_break)
+    if max_cost <= DIAL_MAX_COST:
+        return DialQueue(max_cost, tie_break)
+    return RadixHeap(tie_break)
+
+# --- Benchmark ---
+
+def _queue_throughput(queue, operations, max_cost, seed):
+    import random
+    import time
+
+    rng = random.Random(seed)
+    start_time = time.perf_counter()
+    for _ in range(operations // 10):
+        queue.push(rng.randint(0, max_cost), rng.randrange(1000), None)
+    for _ in range(operations):
+        priority, _ = queue.pop()
+        queue.push(priority + rng.randint(1, max_cost), rng.randrange(1000), None)
+    return 2 * operations / (time.perf_counter() - start_time)
+
+def benchmark(side=300, queries=3, operations=300000, seed=0):
+    """Queue and UCS throughput of each frontier, checking identical UCS results."""
+    import random
+    import time
+    from distance_matrix import random_grid_graph
+    from CUS1 import uniform_cost_search
+
+    queues = {
+        'heap': lambda costs, tie_break: PriorityQueue(tie_break),
+        'dial': lambda costs, tie_break: DialQueue(9, tie_break),
+        'radix': lambda costs, tie_break: RadixHeap(tie_break),
+    }
+
+    print(f"Queue only: {operations} pop/push pairs, costs 1-9")
+    for tie_break in ('node', 'fifo', 'lifo'):
+        for name, factory in queues.items():
+            rate = _queue_throughput(factory(None, tie_break), operations, 9, seed)
+            print(f"{tie_break:<5} {name:<6} {rate:>12,.0f} ops/s")
+
+    edges = random_grid_graph(side, side, seed)
+    rng = random.Random(seed)
+    pairs = [(rng.randrange(side * side), [rng.randrange(side * side)]) for _ in range(queries)]
+    print(f"UCS on grid {side}x{side}: {len(edges)} nodes, {queries} queries, fifo tie-break")
+
+    # The automatic choice, with the cost scan done once for all queries
+    max_cost = integer_max_cost(cost for neighbors in edges.values() for cost in neighbors.values())
+    queues['auto'] = lambda costs, tie_break: make_queue(tie_break=tie_break, max_cost=max_cost)
+
+    baseline = None
+    for name, factory in queues.items():
+        start_time = time.perf_counter()
+        results = [uniform_cost_search(None, edges, origin, destinations, 'fifo', queue=lambda: factory(None, 'fifo'))
+                   for origin, destinations in pairs]
+        elapsed = time.perf_counter() - start_time
+        created = sum(nodes_created for _, _, nodes_created in results)
+        if baseline is None:
+            baseline = results
+        same = "identical" if results == baseline else "DIFFERENT"
+        print(f"{name:<6} {elapsed:.2f}s  {created / elapsed:,.0f} nodes/s  {same}")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        benchmark(side=int(sys.argv[1]))
+    else:
+        benchmark()
@@ -84,7 +84,7 @@ def parse_input_file(filename):
 
     return graph, origin, destinations, nodes
 
-def depth_first_search(graph, origin, destinations):
+def depth_first_search(graph, origin, destinations, index=None):
     """
     Performs Depth-First Search to find a path from origin to any destination.
 
@@ -92,12 +92,19 @@ def depth_first_search(graph, origin, destinations):
         graph (dict): Adjacency list representation {node: {neighbor: cost}}.
         origin (int): The starting node.
         destinations (set): A set of destination nodes.
+        index (ReachabilityIndex | None): Optional precomputed reachability index,
+            used to drop unreachable destinations before searching.
 
     Returns:
         tuple: A tuple containing:
             - path (list | None): The path found as a list of nodes, or None if no path exists.
             - nodes_expanded (int): The number of nodes expanded during the search.
     """
+    if index is not None:
+        destinations = index.prune(origin, destinations)
+        if not destinations:
+            return None, 0 # No destination can be reached, nothing to expand
+
     if origin in destinations:
         return [origin], 0 # Path is just the origin, 0 expansions
 
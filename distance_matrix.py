@@ -0,0 +1,161 @@
+import os
+import sys
+import heapq
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from graph_utils import build_path
+
+# --- One-to-many Dijkstra ---
+
+def one_to_many(graph, origin, destinations):
+    """
+    Runs Dijkstra from a single origin until every destination is settled.
+
+    Args:
+        graph (dict): Adjacency list representation {node: {neighbor: cost}}.
+        origin (int): The starting node.
+        destinations (iterable): The destination nodes to settle.
+
+    Returns:
+        tuple: A tuple containing:
+            - dist (dict): Settled cost for every node popped from the frontier.
+            - parent (dict): Predecessor of every settled node, used to rebuild paths.
+    """
+    remaining = set(destinations)
+    dist = {}
+    parent = {origin: None}
+    best = {origin: 0}
+    frontier = [(0, origin)]
+
+    while frontier and remaining:
+        cost, current = heapq.heappop(frontier)
+        if current in dist:
+            continue
+
+        dist[current] = cost
+        remaining.discard(current) # Stop early once all destinations are settled
+
+        for neighbor, edge_cost in graph.get(current, {}).items():
+            if neighbor in dist:
+                continue
+            new_cost = cost + edge_cost
+            if new_cost < best.get(neighbor, float('inf')):
+                best[neighbor] = new_cost
+                parent[neighbor] = current
+                heapq.heappush(frontier, (new_cost, neighbor))
+
+    return dist, parent
+
+# --- Process pool workers ---
+
+_worker_graph = None
+
+def _init_worker(graph):
+    # Each worker receives the graph once instead of once per origin
+    global _worker_graph
+    _worker_graph = graph
+
+def _matrix_row(args):
+    origin, destinations, return_paths = args
+    dist, parent = one_to_many(_worker_graph, origin, destinations)
+    row = [dist.get(dest, float('inf')) for dest in destinations]
+    paths = None
+    if return_paths:
+        paths = [build_path(parent, dest) if dest in dist else None for dest in destinations]
+    return row, paths
+
+# --- Distance matrix ---
+
+def distance_matrix(graph, origins, destinations, return_paths=False, processes=None):
+    """
+    Computes the origin x destination shortest path cost matrix.
+
+    One one-to-many Dijkstra is run per origin and the origins are spread
+    across a process pool. Unreachable pairs are reported as infinity.
+
+    Args:
+        graph (dict): Adjacency list representation {node: {neighbor: cost}}.
+        origins (list): Row nodes of the matrix.
+        destinations (list): Column nodes of the matrix.
+        return_paths (bool): Also return the node path for every pair.
+        processes (int | None): Worker count, 1 runs in-process, None uses every CPU.
+
+    Returns:
+        numpy.ndarray | tuple: The (len(origins), len(destinations)) cost matrix,
+        or (matrix, paths) when return_paths is set, where paths[i][j] is a list
+        of nodes or None if the destination is unreachable.
+    """
+    origins = list(origins)
+    destinations = list(destinations)
+    tasks = [(origin, destinations, return_paths) for origin in origins]
+
+    if processes == 1 or len(origins) <= 1:
+        _init_worker(graph)
+        rows = list(map(_matrix_row, tasks))
+    else:
+        workers = processes or os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(graph,)) as pool:
+            rows = list(pool.map(_matrix_row, tasks, chunksize=chunksize))
+
+    matrix = np.array([row for row, _ in rows], dtype=float).reshape(len(origins), len(destinations))
+    if return_paths:
+        return matrix, [paths for _, paths in rows]
+    return matrix
+
+# --- Benchmark ---
+
+def random_grid_graph(width, height, seed=0):
+    """Builds a bidirectional grid graph with small random integer edge costs."""
+    rng = random.Random(seed)
+    graph = {}
+    for x in range(width):
+        for y in range(height):
+            node = x * height + y
+            graph.setdefault(node, {})
+            for dx, dy in ((1, 0), (0, 1)):
+                nx, ny = x + dx, y + dy
+                if nx < width and ny < height:
+                    neighbor = nx * height + ny
+                    cost = rng.randint(1, 9)
+                    graph[node][neighbor] = cost
+                    graph.setdefault(neighbor, {})[node] = cost
+    return graph
+
+def benchmark(side=300, sizes=(100, 250, 500, 1000), processes=None):
+    """Times matrices of increasing size against one CUS1 search per cell."""
+    graph = random_grid_graph(side, side)
+    all_nodes = list(graph)
+    rng = random.Random(1)
+    print(f"Grid {side}x{side}: {len(all_nodes)} nodes")
+
+    for size in sizes:
+        origins = rng.sample(all_nodes, size)
+        destinations = rng.sample(all_nodes, size)
+
+        start_time = time.perf_counter()
+        distance_matrix(graph, origins, destinations, processes=processes)
+        elapsed = time.perf_counter() - start_time
+        print(f"{size}x{size}: {elapsed:.2f}s ({size * size / elapsed:,.0f} pairs/s)")
+
+    # Baseline: one CUS1 search per pair, as callers did before this module
+    from CUS1 import uniform_cost_search
+    sample = 5
+    origins = rng.sample(all_nodes, sample)
+    destinations = rng.sample(all_nodes, sample)
+    start_time = time.perf_counter()
+    for origin in origins:
+        for dest in destinations:
+            uniform_cost_search(None, graph, origin, [dest])
+    elapsed = time.perf_counter() - start_time
+    print(f"Pairwise CUS1 baseline: {sample * sample / elapsed:,.0f} pairs/s")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        benchmark(side=int(sys.argv[1]))
+    else:
+        benchmark()
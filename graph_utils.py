@@ -0,0 +1,23 @@
+# --- Shared graph helpers ---
+#
+# Kept free of heavy imports so the CLI and the strategies can use them
+# without paying for numpy or multiprocessing.
+
+def pair_edges(edges):
+    """Converts {from: {to: cost}} into the {(from, to): cost} map used by Nodes_GBFS."""
+    return {(from_node, to_node): cost for from_node, neighbors in edges.items() for to_node, cost in neighbors.items()}
+
+def adjacency_from_pairs(pairs):
+    """Converts a {(from, to): cost} map back into {from: {to: cost}}."""
+    edges = {}
+    for (from_node, to_node), cost in pairs.items():
+        edges.setdefault(from_node, {})[to_node] = cost
+    return edges
+
+def build_path(parent, destination):
+    """Follows the parent links back from destination to the node whose parent is None."""
+    path = [destination]
+    while parent[path[-1]] is not None:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
@@ -0,0 +1,194 @@
+import sys
+import json
+import time
+import multiprocessing
+from collections import Counter
+from queue import Empty
+
+import search
+
+DEFAULT_METHODS = ('DFS', 'GBFS', 'AS', 'CUS1')
+OPTIMAL_METHODS = {'AS', 'CUS1'} # Return least-cost paths
+INCOMPLETE_METHODS = {'BEAM', 'BGBFS', 'RAND'} # May miss a path that exists; RAND can run out of budget
+
+# --- Win statistics ---
+
+class PortfolioStats:
+    """Per-strategy win counts and latencies, used to tune the portfolio."""
+    def __init__(self):
+        self.runs = 0
+        self.wins = Counter()
+        self.win_time = Counter()
+
+    def record(self, method, elapsed):
+        self.runs += 1
+        if method is not None:
+            self.wins[method] += 1
+            self.win_time[method] += elapsed
+
+    def win_rate(self, method):
+        return self.wins[method] / self.runs if self.runs else 0.0
+
+    def ranked(self):
+        """Methods ordered by number of wins, most successful first."""
+        return [method for method, _ in self.wins.most_common()]
+
+    def summary(self):
+        lines = [f"{self.runs} runs"]
+        for method in self.ranked():
+            average = self.win_time[method] / self.wins[method]
+            lines.append(f"{method:<6} won {self.wins[method]:>4} ({self.win_rate(method):.0%}), avg {average * 1000:.1f} ms")
+        return "\n".join(lines)
+
+    def save(self, filename):
+        with open(filename, 'w') as f:
+            json.dump({'runs': self.runs, 'wins': self.wins, 'win_time': self.win_time}, f)
+
+    @classmethod
+    def load(cls, filename):
+        stats = cls()
+        try:
+            with open(filename, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return stats
+        stats.runs = data['runs']
+        stats.wins.update(data['wins'])
+        stats.win_time.update(data['win_time'])
+        return stats
+
+# --- Portfolio search ---
+
+def _worker(method, strategy, problem, options, results):
+    try:
+        module, runner = strategy or search.load_strategy(method)
+        results.put((method, runner(module, problem, options)))
+    except Exception:
+        results.put((method, None)) # A failed strategy never wins, but must not stall the wait
+        raise
+
+def _context():
+    # Forked workers share the parsed graph copy-on-write instead of unpickling it
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+def portfolio_search(problem, methods=DEFAULT_METHODS, optimal=False, timeout=None, stats=None, options=None):
+    """
+    Runs several strategies in parallel processes and keeps the first acceptable answer.
+
+    An answer is acceptable when it is a path (from an optimal strategy if
+    `optimal` is set) or a "no path" result from a complete strategy, which
+    proves no destination is reachable. The remaining workers are terminated.
+
+    Args:
+        problem (tuple): (nodes, edges, origin, destinations) as read by CUS1.read_problem_file.
+        methods (iterable): Method codes registered in search.py.
+        optimal (bool): Only accept paths from strategies in OPTIMAL_METHODS.
+        timeout (float | None): Seconds to wait before giving up.
+        stats (PortfolioStats | None): Records the winning strategy.
+        options (dict | None): Passed through to the strategy runners.
+
+    Returns:
+        tuple: (path, goal, node_count, winner), winner is None if nothing was accepted.
+    """
+    methods = list(methods)
+    if optimal and not OPTIMAL_METHODS.intersection(methods):
+        raise ValueError(f"An optimal portfolio needs one of {', '.join(sorted(OPTIMAL_METHODS))}")
+
+    context = _context()
+    # Import in the parent so forked workers inherit the loaded modules;
+    # modules cannot be pickled, so spawned workers still import their own
+    forked = context.get_start_method() == 'fork'
+    strategies = {method: search.load_strategy(method) if forked else None for method in methods}
+    results = context.Queue()
+    start_time = time.perf_counter()
+    workers = [context.Process(target=_worker, args=(method, strategies[method], problem, options or {}, results), daemon=True) for method in methods]
+    for worker in workers:
+        worker.start()
+
+    answer = (None, None, 0, None)
+    try:
+        for _ in methods:
+            remaining = None if timeout is None else timeout - (time.perf_counter() - start_time)
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                method, result = results.get(timeout=remaining)
+            except Empty:
+                break
+            if result is None:
+                continue
+            path, goal, node_count = result
+            if path is not None and (not optimal or method in OPTIMAL_METHODS):
+                answer = (path, goal, node_count, method)
+                break
+            if path is None and method not in INCOMPLETE_METHODS:
+                answer = (None, None, node_count, method)
+                break
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+        for worker in workers:
+            worker.join()
+        results.close()
+
+    if stats is not None:
+        stats.record(answer[3], time.perf_counter() - start_time)
+    return answer
+
+# --- Benchmark ---
+
+def benchmark(graphs=4, queries=5, size=4000):
+    """Latency of each single strategy against the portfolio on mixed inputs."""
+    import random
+    from bounded_search import random_geometric_graph
+    from graph_utils import adjacency_from_pairs
+
+    rng = random.Random(0)
+    problems = []
+    for seed in range(graphs):
+        nodes, pairs = random_geometric_graph(size, seed, radius=rng.choice((12, 18, 30)))
+        edges = adjacency_from_pairs(pairs)
+        for _ in range(queries):
+            origin, destination = rng.sample(sorted(nodes), 2)
+            problems.append((nodes, edges, origin, [destination]))
+
+    latencies = {}
+    for method in DEFAULT_METHODS:
+        module, runner = search.load_strategy(method)
+        for problem in problems:
+            start_time = time.perf_counter()
+            runner(module, problem, {})
+            latencies.setdefault(method, []).append(time.perf_counter() - start_time)
+
+    stats = PortfolioStats()
+    for problem in problems:
+        start_time = time.perf_counter()
+        portfolio_search(problem, stats=stats)
+        latencies.setdefault('PORT', []).append(time.perf_counter() - start_time)
+
+    print(f"{len(problems)} queries on {graphs} graphs of {size} nodes")
+    for method, values in latencies.items():
+        values.sort()
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        print(f"{method:<5} median {values[len(values) // 2] * 1000:8.1f} ms  p95 {p95 * 1000:8.1f} ms  max {values[-1] * 1000:8.1f} ms")
+    print(stats.summary())
+
+if __name__ == "__main__":
+    if len(sys.argv) in (2, 3):
+        # python portfolio.py <filename> [stats.json]
+        from CUS1 import read_problem_file
+        stats = PortfolioStats.load(sys.argv[2]) if len(sys.argv) == 3 else PortfolioStats()
+        path, goal, node_count, winner = portfolio_search(read_problem_file(sys.argv[1]), stats=stats)
+        print(f"{sys.argv[1]} PORT ({winner})")
+        if path:
+            print(f"{goal} {node_count}")
+            print(" ".join(str(node) for node in path))
+        else:
+            print("No solution found")
+        if len(sys.argv) == 3:
+            stats.save(sys.argv[2])
+    else:
+        benchmark()
@@ -0,0 +1,51 @@
+import heapq
+
+# --- Priority Queue ---
+#
+# Heap entries are (priority, tie, sequence, item). `priority` is f (or g/h,
+# depending on the strategy), `tie` depends on the tie-breaking rule and
+# `sequence` is a per-queue insertion counter. The counter is unique, so two
+# entries never compare past it and `item` (usually a path list) is never
+# compared: every comparison costs at most three number comparisons.
+#
+# Tie-breaking rules, applied when priorities are equal:
+#   'node'  - lowest node ID first, then oldest entry (the assignment's rule)
+#   'fifo'  - oldest entry first
+#   'lifo'  - newest entry first
+#   'low_h' - lowest heuristic value first, then oldest entry
+
+TIE_BREAKS = ('node', 'fifo', 'lifo', 'low_h')
+
+class PriorityQueue:
+    """Min-priority queue shared by the heap based search strategies."""
+    def __init__(self, tie_break='node'):
+        if tie_break not in TIE_BREAKS:
+            raise ValueError(f"Unknown tie-break rule '{tie_break}', expected one of {', '.join(TIE_BREAKS)}")
+        self.tie_break = tie_break
+        self.heap = []
+        self.sequence = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def push(self, priority, node, item, h=0):
+        """Adds `item` for `node`; `h` is only used by the 'low_h' rule."""
+        self.sequence += 1
+        heapq.heappush(self.heap, (priority,) + self._tie_key(node, h) + (item,))
+
+    def pop(self):
+        """Removes and returns (priority, item) for the best entry."""
+        entry = heapq.heappop(self.heap)
+        return entry[0], entry[3]
+
+    def _tie_key(self, node, h):
+        if self.tie_break == 'node':
+            return (node, self.sequence)
+        if self.tie_break == 'fifo':
+            return (0, self.sequence)
+        if self.tie_break == 'lifo':
+            return (0, -self.sequence)
+        return (h, self.sequence)
@@ -0,0 +1,181 @@
+import os
+import sys
+import random
+import time
+
+from graph_utils import adjacency_from_pairs, build_path
+
+# --- Restart schedules ---
+
+def luby(index):
+    """The index-th term (1-based) of the Luby sequence: 1 1 2 1 1 2 4 1 1 2 ..."""
+    while True:
+        k = 1
+        while (1 << k) - 1 < index:
+            k += 1
+        if (1 << k) - 1 == index:
+            return 1 << (k - 1)
+        index -= (1 << (k - 1)) - 1
+
+def restart_limits(schedule='luby', unit=100, factor=1.5):
+    """Yields the expansion limit of each successive restart."""
+    attempt = 1
+    while True:
+        if schedule == 'luby':
+            yield unit * luby(attempt)
+        elif schedule == 'geometric':
+            yield int(unit * factor ** (attempt - 1))
+        elif schedule is None:
+            yield float('inf') # A single attempt without restarts
+        else:
+            raise ValueError(f"Unknown restart schedule '{schedule}', expected 'luby', 'geometric' or None")
+        attempt += 1
+
+# --- Randomized search ---
+
+def path_cost(edges, path):
+    return sum(edges[a][b] for a, b in zip(path, path[1:]))
+
+def random_dfs(edges, origin, destinations, rng, limit):
+    """
+    Depth-first search that visits neighbors in a random order.
+
+    Returns:
+        tuple: (path, nodes_expanded), path is None if no destination was
+        reached within `limit` expansions.
+    """
+    if origin in destinations:
+        return [origin], 0
+
+    parents = {origin: None}
+    stack = [origin]
+    nodes_expanded = 0
+
+    while stack and nodes_expanded < limit:
+        current = stack.pop()
+        nodes_expanded += 1
+
+        neighbors = [neighbor for neighbor in edges.get(current, {}) if neighbor not in parents]
+        rng.shuffle(neighbors)
+        for neighbor in neighbors:
+            parents[neighbor] = current
+            if neighbor in destinations:
+                return build_path(parents, neighbor), nodes_expanded
+            stack.append(neighbor)
+
+    return None, nodes_expanded
+
+def randomized_search(edges, origin, destinations, seed=None, schedule='luby', unit=100, budget=None):
+    """
+    Randomized DFS with restarts, reproducible for a given seed.
+
+    Each restart runs random_dfs from the origin with the next limit from the
+    restart schedule. Without a budget the first path found is returned; with
+    a budget (total node expansions) restarts continue until it is spent and
+    the cheapest path seen is kept.
+
+    Args:
+        edges (dict): Adjacency list representation {node: {neighbor: cost}}.
+        origin (int): The starting node.
+        destinations (iterable): Destination nodes.
+        seed (int | None): Random seed, None for a non-reproducible run.
+        schedule (str | None): 'luby', 'geometric' or None for no restarts.
+        unit (int): Expansion limit of the shortest restart.
+        budget (int | None): Total expansions allowed across restarts.
+
+    Returns:
+        tuple: (path, cost, nodes_expanded), path is None if nothing was found.
+    """
+    rng = random.Random(seed)
+    destinations = set(destinations)
+    if origin in destinations:
+        return [origin], 0, 0
+    best_path, best_cost = None, float('inf')
+    total_expanded = 0
+
+    for limit in restart_limits(schedule, unit):
+        if budget is not None:
+            limit = min(limit, budget - total_expanded)
+        path, nodes_expanded = random_dfs(edges, origin, destinations, rng, limit)
+        total_expanded += nodes_expanded
+
+        if path is not None:
+            cost = path_cost(edges, path)
+            if cost < best_cost:
+                best_path, best_cost = path, cost
+            if budget is None:
+                break
+        elif nodes_expanded < limit:
+            break # The attempt exhausted the reachable graph: no path exists
+
+        # A restart that expands nothing would repeat forever
+        if nodes_expanded == 0 or (budget is not None and total_expanded >= budget):
+            break
+
+    return best_path, best_cost if best_path else None, total_expanded
+
+# --- Parallel runs ---
+
+_worker_edges = None
+
+def _init_worker(edges):
+    global _worker_edges
+    _worker_edges = edges
+
+def _seeded_run(args):
+    seed, origin, destinations, kwargs = args
+    return seed, randomized_search(_worker_edges, origin, destinations, seed=seed, **kwargs)
+
+def parallel_randomized_search(edges, origin, destinations, runs=4, seed=0, processes=None, **kwargs):
+    """
+    Runs `runs` independent seeded randomized searches across a process pool.
+
+    Run i uses seed `seed + i`, so the whole batch is reproducible. Extra
+    keyword arguments are passed to randomized_search.
+
+    Returns:
+        tuple: (path, cost, best_seed, nodes_expanded) for the cheapest path,
+        with nodes_expanded summed over all runs.
+    """
+    tasks = [(seed + run, origin, list(destinations), kwargs) for run in range(runs)]
+
+    if processes == 1 or runs == 1:
+        _init_worker(edges)
+        results = list(map(_seeded_run, tasks))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=processes or os.cpu_count(), initializer=_init_worker, initargs=(edges,)) as pool:
+            results = list(pool.map(_seeded_run, tasks))
+
+    total_expanded = sum(nodes_expanded for _, (_, _, nodes_expanded) in results)
+    found = [(cost, run_seed, path) for run_seed, (path, cost, _) in results if path is not None]
+    if not found:
+        return None, None, None, total_expanded
+    cost, run_seed, path = min(found)
+    return path, cost, run_seed, total_expanded
+
+# --- Benchmark ---
+
+def benchmark(size=20000, runs=(1, 4, 8), budget=20000, seed=0):
+    """Best path cost and time for increasing numbers of seeded runs."""
+    from bounded_search import random_geometric_graph
+
+    nodes, pairs = random_geometric_graph(size, seed)
+    edges = adjacency_from_pairs(pairs)
+    rng = random.Random(seed)
+    origin, destination = rng.sample(sorted(nodes), 2)
+    print(f"{len(nodes)} nodes, {len(pairs)} edges, budget {budget} expansions per run")
+
+    for schedule in ('luby', 'geometric', None):
+        for count in runs:
+            start_time = time.perf_counter()
+            path, cost, best_seed, expanded = parallel_randomized_search(
+                edges, origin, [destination], runs=count, seed=seed, schedule=schedule, budget=budget)
+            elapsed = time.perf_counter() - start_time
+            print(f"{str(schedule):<9} runs {count:>2}  cost {cost}  seed {best_seed}  expanded {expanded:>7}  {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        benchmark(size=int(sys.argv[1]))
+    else:
+        benchmark()
@@ -0,0 +1,196 @@
+import sys
+import random
+import time
+from collections import OrderedDict
+
+DEFAULT_MAX_CLOSURE = 8192 # Components; the bitset closure needs C^2 / 8 bytes
+DEFAULT_CACHE_SIZE = 64
+
+# --- Strongly connected components ---
+
+def strongly_connected_components(edges):
+    """
+    Tarjan's algorithm with an explicit stack, so deep graphs do not hit the
+    recursion limit.
+
+    Args:
+        edges (dict): Adjacency map {node: iterable of neighbors}; the
+            {node: {neighbor: cost}} dictionaries used by the strategies work as is.
+
+    Returns:
+        tuple: A tuple containing:
+            - component_of (dict): Mapping of node to component number.
+            - components (list): Member lists, in reverse topological order
+              (every component comes after all components it can reach).
+    """
+    nodes = set(edges)
+    for neighbors in edges.values():
+        nodes.update(neighbors)
+
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    component_of = {}
+    components = []
+
+    for root in sorted(nodes):
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(edges.get(root, ())))]
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = low[neighbor] = len(index)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(edges.get(neighbor, ()))))
+                    break
+                if neighbor in on_stack:
+                    low[node] = min(low[node], index[neighbor])
+            else:
+                # Every neighbor handled, return to the parent
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component_of[member] = len(components)
+                        members.append(member)
+                        if member == node:
+                            break
+                    components.append(members)
+
+    return component_of, components
+
+# --- Reachability index ---
+
+class ReachabilityIndex:
+    """Answers "can origin reach destination?" after one preprocessing pass.
+
+    The graph is condensed into its DAG of strongly connected components. Up
+    to `max_closure` components, every component stores the set of components
+    it can reach as a bitset and every query is O(1); the closure costs
+    O(C^2 / 8) bytes, about 8 MiB at the default 8192 components. Beyond that
+    (one-way road networks are close to DAGs, so C approaches the node count)
+    only the condensation DAG is kept: origin and destination in the same
+    component is still O(1), anything else is a search over the DAG whose
+    result is cached for the last `cache_size` origin components.
+
+    Build it once per graph and pass it to the strategies as `index` to skip
+    searches that cannot succeed.
+    """
+    def __init__(self, edges, max_closure=DEFAULT_MAX_CLOSURE, cache_size=DEFAULT_CACHE_SIZE):
+        self.component_of, components = strongly_connected_components(edges)
+        self.component_count = len(components)
+        self.reach = None
+        self.successors = None
+        self.cache = OrderedDict() # origin component -> set of reachable components
+        self.cache_size = cache_size
+
+        if self.component_count <= max_closure:
+            self._build_closure(edges, components)
+        else:
+            self.successors = [set() for _ in components]
+            for number, members in enumerate(components):
+                for member in members:
+                    for neighbor in edges.get(member, ()):
+                        successor = self.component_of[neighbor]
+                        if successor != number:
+                            self.successors[number].add(successor)
+
+    def _build_closure(self, edges, components):
+        # Components are numbered in reverse topological order, so every
+        # successor's bitset is complete before it is needed
+        reach = []
+        for number, members in enumerate(components):
+            bits = 1 << number
+            for member in members:
+                for neighbor in edges.get(member, ()):
+                    successor = self.component_of[neighbor]
+                    if successor != number:
+                        bits |= reach[successor]
+            reach.append(bits)
+
+        size = (len(components) + 7) // 8
+        self.reach = [bits.to_bytes(size, 'little') for bits in reach]
+
+    def reachable(self, origin, destination):
+        source = self.component_of.get(origin)
+        target = self.component_of.get(destination)
+        if source is None or target is None:
+            return origin == destination
+        if source == target:
+            return True
+        if self.reach is not None:
+            return (self.reach[source][target >> 3] >> (target & 7)) & 1 == 1
+        # Successors always have lower numbers, so the target can only be
+        # reached from components numbered above it
+        if target > source:
+            return False
+        return target in self._reachable_components(source)
+
+    def _reachable_components(self, source):
+        if source in self.cache:
+            self.cache.move_to_end(source)
+            return self.cache[source]
+        seen = {source}
+        stack = [source]
+        while stack:
+            for successor in self.successors[stack.pop()]:
+                if successor not in seen:
+                    seen.add(successor)
+                    stack.append(successor)
+        self.cache[source] = seen
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return seen
+
+    def prune(self, origin, destinations):
+        """Returns the destinations reachable from origin, as the same collection type."""
+        reachable = [dest for dest in destinations if self.reachable(origin, dest)]
+        return set(reachable) if isinstance(destinations, (set, frozenset)) else reachable
+
+# --- Benchmark ---
+
+def benchmark(size=20000, queries=20, seed=0):
+    """Latency of unreachable queries with and without the index."""
+    from CUS1 import uniform_cost_search
+
+    # Two large one-way connected regions: nothing in the second reaches the first
+    rng = random.Random(seed)
+    half = size // 2
+    edges = {node: {} for node in range(size)}
+    for node in range(size):
+        low, high = (0, half) if node < half else (half, size)
+        for _ in range(3):
+            edges[node][rng.randrange(low, high)] = rng.randint(1, 9)
+    for _ in range(10):
+        edges[rng.randrange(half)][rng.randrange(half, size)] = 1
+
+    start_time = time.perf_counter()
+    index = ReachabilityIndex(edges)
+    print(f"{size} nodes, {index.component_count} components, index built in {time.perf_counter() - start_time:.2f}s")
+
+    pairs = [(rng.randrange(half, size), [rng.randrange(half)]) for _ in range(queries)]
+    for label, kwargs in (("without index", {}), ("with index", {"index": index})):
+        start_time = time.perf_counter()
+        for origin, destinations in pairs:
+            uniform_cost_search(None, edges, origin, destinations, **kwargs)
+        elapsed = (time.perf_counter() - start_time) / queries
+        print(f"{label:<14} {elapsed * 1000:.3f} ms per unreachable query")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        benchmark(size=int(sys.argv[1]))
+    else:
+        benchmark()
@@ -0,0 +1,176 @@
+import sys
+import importlib
+
+from graph_utils import pair_edges
+
+# --- Strategy registry ---
+#
+# Each method code maps to the module implementing it and a runner adapting
+# the parsed problem to that module's API. Modules are only imported when
+# their method is requested, so a CLI call pays for one strategy, not all.
+
+STRATEGIES = {}
+
+def register(method, module):
+    """Registers `runner(module, problem, options)` as the handler for a method code."""
+    def decorator(runner):
+        STRATEGIES[method] = (module, runner)
+        return runner
+    return decorator
+
+def load_strategy(method):
+    """Imports the strategy module on first use and returns (module, runner)."""
+    module_name, runner = STRATEGIES[method]
+    return importlib.import_module(module_name), runner
+
+# --- Problem adapters ---
+
+def first_destination_path(search, nodes, edges, origin, destinations, *args, **kwargs):
+    """
+    Runs a single-destination search for each destination in order, first path wins.
+    The node count is the nodes created across every search run, like the other strategies report.
+    """
+    edges = pair_edges(edges)
+    nodes_created = 0
+    for destination in destinations:
+        path, created = search(nodes, edges, origin, destination, *args, return_count=True, **kwargs)
+        nodes_created += created
+        if path:
+            return path, destination, nodes_created
+    return None, None, nodes_created
+
+# --- Strategies ---
+
+@register('DFS', 'dfs_search')
+def run_dfs(module, problem, options):
+    nodes, edges, origin, destinations = problem
+    path, nodes_expanded = module.depth_first_search(edges, origin, set(destinations))
+    return path, path[-1] if path else None, nodes_expanded
+
+@register('BFS', 'BFS')
+def run_bfs(module, problem, options):
+    return module.breadth_first_search(*problem)
+
+@register('GBFS', 'Nodes_GBFS')
+def run_gbfs(module, problem, options):
+    return first_destination_path(module.gbfs, *problem, tie_break=options.get('tie_break', 'node'))
+
+@register('AS', 'astar_search')
+def run_astar(module, problem, options):
+    nodes, edges, origin, destinations = problem
+    graph = module.Graph()
+    for node_id, (x, y) in nodes.items():
+        graph.add_node(node_id, x, y)
+    for from_node, neighbors in edges.items():
+        for to_node, cost in neighbors.items():
+            graph.add_edge(from_node, to_node, cost)
+    graph.set_origin(origin)
+    for destination in destinations:
+        graph.add_destination(destination)
+    path, nodes_created = module.a_star_search(graph, options.get('tie_break', 'node'))
+    return path, path[-1] if path else None, nodes_created
+
+@register('CUS1', 'CUS1')
+def run_cus1(module, problem, options):
+    return module.uniform_cost_search(*problem, options.get('tie_break', 'node'))
+
+@register('CUS2', 'Nodes_GBFS')
+def run_cus2(module, problem, options):
+    return first_destination_path(module.custom_informed_search, *problem, tie_break=options.get('tie_break', 'node'))
+
+@register('BEAM', 'bounded_search')
+def run_beam(module, problem, options):
+    width = options.get('width') or module.DEFAULT_WIDTH
+    return first_destination_path(module.beam_search, *problem, width)
+
+@register('BGBFS', 'bounded_search')
+def run_bounded_gbfs(module, problem, options):
+    width = options.get('width') or module.DEFAULT_WIDTH
+    return first_destination_path(module.bounded_gbfs, *problem, width)
+
+@register('RAND', 'random_search')
+def run_random(module, problem, options):
+    nodes, edges, origin, destinations = problem
+    path, _, nodes_expanded = module.randomized_search(
+        edges, origin, destinations, seed=options.get('seed', 0), budget=options.get('budget'))
+    return path, path[-1] if path else None, nodes_expanded
+
+@register('PORT', 'portfolio')
+def run_portfolio(module, problem, options):
+    return module.portfolio_search(problem, options=options)[:3]
+
+# --- Main ---
+
+# Options accepted on the command line as name=value, with their types
+OPTIONS = {'width': int, 'seed': int, 'budget': int, 'tie_break': str}
+USAGE = "Usage: python search.py <filename> <method> [width] [name=value ...]"
+
+def parse_options(args):
+    """
+    Parses the extra command line arguments. A bare number is the BEAM/BGBFS
+    width, everything else must be name=value with a name from OPTIONS.
+
+    Raises:
+        ValueError: For unknown names, values of the wrong type or an unknown tie_break.
+    """
+    options = {}
+    for arg in args:
+        name, _, value = arg.rpartition('=')
+        name = name or 'width'
+        if name not in OPTIONS:
+            raise ValueError(f"Unknown option '{name}', expected one of {', '.join(OPTIONS)}")
+        try:
+            options[name] = OPTIONS[name](value)
+        except ValueError:
+            raise ValueError(f"Option '{name}' expects {OPTIONS[name].__name__}, got '{value}'") from None
+
+    if 'tie_break' in options:
+        from priority_queue import TIE_BREAKS
+        if options['tie_break'] not in TIE_BREAKS:
+            raise ValueError(f"Unknown tie_break '{options['tie_break']}', expected one of {', '.join(TIE_BREAKS)}")
+    return options
+
+def run(filename, method, options=None):
+    """Parses the problem file and runs one strategy, returns (path, goal, node_count)."""
+    from CUS1 import read_problem_file
+
+    module, runner = load_strategy(method)
+    problem = read_problem_file(filename)
+    return runner(module, problem, options or {})
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print(USAGE)
+        print(f"Methods: {', '.join(STRATEGIES)}")
+        return 1
+
+    filename = argv[0]
+    method = argv[1].upper()
+    if method not in STRATEGIES:
+        print(f"Method {method} not implemented")
+        return 1
+
+    try:
+        options = parse_options(argv[2:])
+    except ValueError as e:
+        print(f"Error: {e}")
+        print(USAGE)
+        return 1
+
+    try:
+        path, goal, node_count = run(filename, method, options)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return 1
+
+    print(f"{filename} {method}")
+    if path:
+        print(f"{goal} {node_count}")
+        print(" ".join(str(node) for node in path))
+    else:
+        print("No solution found")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from bucket_queue import DialQueue, RadixHeap, make_queue
+from priority_queue import PriorityQueue
+
+def _pop_order(queue, seed, max_cost, operations=2000):
+    """Random monotone push/pop workload, returns every (priority, item) popped."""
+    rng = random.Random(seed)
+    popped = []
+
+    def push(priority, item):
+        queue.push(priority, rng.randrange(20), item, h=rng.randrange(5))
+
+    for item in range(50):
+        push(rng.randint(0, max_cost), item)
+    for item in range(50, operations):
+        if queue and rng.random() < 0.6:
+            priority, popped_item = queue.pop()
+            popped.append((priority, popped_item))
+            push(priority + rng.randint(0, max_cost), item)
+        else:
+            last = popped[-1][0] if popped else 0
+            push(last + rng.randint(0, max_cost), item)
+    while queue:
+        popped.append(queue.pop())
+    return popped
+
+@pytest.mark.parametrize('tie_break', ['node', 'fifo', 'lifo', 'low_h'])
+@pytest.mark.parametrize('max_cost', [1, 9, 5000])
+@pytest.mark.parametrize('seed', range(5))
+def test_bucket_queues_match_priority_queue(tie_break, max_cost, seed):
+    expected = _pop_order(PriorityQueue(tie_break), seed, max_cost)
+    assert _pop_order(DialQueue(max_cost, tie_break), seed, max_cost) == expected
+    assert _pop_order(RadixHeap(tie_break), seed, max_cost) == expected
+
+def test_make_queue_selection():
+    assert type(make_queue([1, 2, 3], 'node')) is PriorityQueue
+    assert type(make_queue([1.5, 2], 'fifo')) is PriorityQueue
+    assert type(make_queue([-1, 2], 'fifo')) is PriorityQueue
+    assert type(make_queue([1, 2, 3], 'fifo')) is DialQueue
+    assert type(make_queue([1, 10 ** 6], 'lifo')) is RadixHeap
+    assert type(make_queue(tie_break='fifo', max_cost=9)) is DialQueue
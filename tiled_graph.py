@@ -0,0 +1,332 @@
+import os
+import sys
+from collections import OrderedDict
+
+from astar_search import euclidean_distance
+from priority_queue import PriorityQueue
+
+DEFAULT_TILE_SIZE = 32
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+INDEX_FILE = "index.txt"
+INDEX_WIDTH = 12 # Characters per field in an index record
+INDEX_RECORD = 3 * INDEX_WIDTH + 1
+COORDS_BYTES = sys.getsizeof((0, 0))
+
+# --- Building the tiled layout ---
+
+def tile_key(coords, tile_size):
+    """Returns the (tx, ty) tile a coordinate falls into."""
+    x, y = coords
+    return (x // tile_size, y // tile_size)
+
+def tile_filename(key):
+    return f"tile_{key[0]}_{key[1]}.txt"
+
+def build_tiles(nodes, edges, directory, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Writes a graph to disk partitioned into square tiles by node coordinates.
+
+    Each tile file lists its nodes and their outgoing edges, and every edge
+    carries the target's coordinates so a search can tell which tile the
+    target lives in (and compute a heuristic) without loading that tile.
+    The index file maps node IDs to tiles and is only searched to locate the
+    origin and destinations of a query.
+
+    Args:
+        nodes (dict): Mapping of node ID to (x, y) coordinates.
+        edges (dict): Adjacency list representation {node: {neighbor: cost}}.
+        directory (str): Output directory, created if missing.
+        tile_size (int): Width and height of a tile in coordinate units.
+
+    Returns:
+        int: The number of tiles written.
+
+    Raises:
+        ValueError: If a node ID or tile coordinate is wider than INDEX_WIDTH characters.
+    """
+    os.makedirs(directory, exist_ok=True)
+    tiles = {}
+    for node_id, coords in nodes.items():
+        tiles.setdefault(tile_key(coords, tile_size), []).append(node_id)
+
+    for key, members in tiles.items():
+        with open(os.path.join(directory, tile_filename(key)), 'w') as f:
+            f.write("Nodes:\n")
+            for node_id in members:
+                x, y = nodes[node_id]
+                f.write(f"{node_id}: ({x},{y})\n")
+            f.write("Edges:\n")
+            for node_id in members:
+                for neighbor, cost in edges.get(node_id, {}).items():
+                    if neighbor not in nodes:
+                        continue
+                    nx, ny = nodes[neighbor]
+                    f.write(f"({node_id},{neighbor}): {cost} @ ({nx},{ny})\n")
+
+    # Fixed-width records sorted by node ID, so a lookup is a binary search
+    # over file offsets instead of a scan of the whole index
+    records = []
+    for node_id, (tx, ty) in sorted((node_id, key) for key, members in tiles.items() for node_id in members):
+        record = f"{node_id:>{INDEX_WIDTH}}{tx:>{INDEX_WIDTH}}{ty:>{INDEX_WIDTH}}\n"
+        if len(record) != INDEX_RECORD:
+            raise ValueError(f"Node {node_id} in tile ({tx}, {ty}) does not fit the {INDEX_WIDTH}-character index fields")
+        records.append(record)
+    # '\n' on every platform, TiledGraph seeks by INDEX_RECORD bytes
+    with open(os.path.join(directory, INDEX_FILE), 'w', newline='\n') as f:
+        f.write(f"Tile size:\n{tile_size}\nIndex:\n")
+        f.writelines(records)
+
+    return len(tiles)
+
+# --- Lazy tiled graph ---
+
+def _estimate_bytes(edges, where):
+    # Shallow container sizes plus one coordinate tuple per entry; ints are
+    # mostly shared small objects, so this is close to the real footprint
+    return (sys.getsizeof(edges) + sum(sys.getsizeof(neighbors) for neighbors in edges.values())
+            + sys.getsizeof(where) + len(where) * COORDS_BYTES)
+
+class TiledGraph:
+    """Read-only adjacency map that faults tiles in from disk on demand.
+
+    Behaves like the {node: {neighbor: cost}} dictionaries used by
+    breadth_first_search, uniform_cost_search and depth_first_search, so those
+    strategies run unchanged on top of it. Loaded tiles, including the node
+    coordinates they carry, are kept within roughly `max_bytes` of memory; the
+    least recently used tile is dropped when the cap is hit. The size of a
+    tile is estimated from its containers when it is loaded.
+    """
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.tiles = OrderedDict() # tile key -> (edges, where, estimated bytes)
+        self.loaded_bytes = 0
+        self.tile_loads = 0
+        self.tile_evictions = 0
+
+        with open(os.path.join(directory, INDEX_FILE), 'rb') as f:
+            f.readline()
+            self.tile_size = int(f.readline().strip())
+            f.readline()
+            self.index_offset = f.tell()
+            f.seek(0, os.SEEK_END)
+            self.index_count = (f.tell() - self.index_offset) // INDEX_RECORD
+
+    def coords(self, node_id):
+        """Returns the (x, y) coordinates of a node, or None if it does not exist."""
+        # Nodes reached by an edge are known to the tile holding that edge,
+        # which is usually the most recently used one
+        for _, where, _ in reversed(self.tiles.values()):
+            if node_id in where:
+                return where[node_id]
+        key = self._find_in_index(node_id)
+        if key is None:
+            return None
+        return self._tile(key)[1].get(node_id)
+
+    def get(self, node_id, default=None):
+        coords = self.coords(node_id)
+        if coords is None:
+            return default
+        return self._tile(tile_key(coords, self.tile_size))[0].get(node_id, default)
+
+    def __getitem__(self, node_id):
+        neighbors = self.get(node_id)
+        if neighbors is None:
+            raise KeyError(node_id)
+        return neighbors
+
+    def __contains__(self, node_id):
+        return self.coords(node_id) is not None
+
+    def _find_in_index(self, node_id):
+        # Binary search over the sorted fixed-width records, O(log n) reads
+        with open(os.path.join(self.directory, INDEX_FILE), 'rb') as f:
+            low, high = 0, self.index_count
+            while low < high:
+                middle = (low + high) // 2
+                f.seek(self.index_offset + middle * INDEX_RECORD)
+                record = f.read(INDEX_RECORD)
+                found = int(record[:INDEX_WIDTH])
+                if found == node_id:
+                    return (int(record[INDEX_WIDTH:2 * INDEX_WIDTH]), int(record[2 * INDEX_WIDTH:3 * INDEX_WIDTH]))
+                if found < node_id:
+                    low = middle + 1
+                else:
+                    high = middle
+        return None
+
+    def _tile(self, key):
+        if key in self.tiles:
+            self.tiles.move_to_end(key)
+            return self.tiles[key]
+        return self._load_tile(key)
+
+    def _load_tile(self, key):
+        edges = {}
+        where = {} # Coordinates of the tile's nodes and of its edge targets
+        path = os.path.join(self.directory, tile_filename(key))
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                section = None
+                for line in f:
+                    line = line.strip()
+                    if line.endswith(':'):
+                        section = line[:-1].lower()
+                    elif section == 'nodes':
+                        node_id, coords = line.split(':', 1)
+                        x, y = coords.strip()[1:-1].split(',')
+                        node_id = int(node_id)
+                        where[node_id] = (int(x), int(y))
+                        edges[node_id] = {}
+                    elif section == 'edges':
+                        edge_desc, rest = line.split(':', 1)
+                        cost, target = rest.split('@')
+                        from_node, to_node = edge_desc.strip()[1:-1].split(',')
+                        x, y = target.strip()[1:-1].split(',')
+                        to_node = int(to_node)
+                        edges[int(from_node)][to_node] = int(cost)
+                        where[to_node] = (int(x), int(y))
+
+        tile = (edges, where, _estimate_bytes(edges, where))
+        self.tiles[key] = tile
+        self.loaded_bytes += tile[2]
+        self.tile_loads += 1
+        # Always keep the tile just loaded, even if it alone exceeds the cap
+        while self.loaded_bytes > self.max_bytes and len(self.tiles) > 1:
+            _, (_, _, size) = self.tiles.popitem(last=False)
+            self.loaded_bytes -= size
+            self.tile_evictions += 1
+        return tile
+
+# --- A* over a tiled graph ---
+
+def a_star_search(tiled, origin, destinations, tie_break='node'):
+    """
+    A* search that only touches the tiles the frontier reaches.
+
+    Args:
+        tiled (TiledGraph): The lazily loaded graph.
+        origin (int): The starting node.
+        destinations (iterable): Destination node IDs.
+        tie_break (str): Ordering of equal f_cost entries, see priority_queue.
+
+    Returns:
+        tuple: (path, nodes_created), path is None if no destination is reachable.
+    """
+    dest_coords = [tiled.coords(dest) for dest in destinations]
+    dest_coords = [coords for coords in dest_coords if coords is not None]
+    if not dest_coords or tiled.coords(origin) is None:
+        return None, 0 # No destination exists on the map
+    destinations = set(destinations)
+
+    def heuristic(node_id):
+        coords = tiled.coords(node_id)
+        return min((euclidean_distance(coords, dest) for dest in dest_coords), default=float('inf'))
+
+    frontier = PriorityQueue(tie_break)
+    frontier.push(heuristic(origin), origin, (0, [origin]), heuristic(origin))
+    explored = {}
+    nodes_created = 1
+
+    while frontier:
+        _, (g_cost, path) = frontier.pop()
+        current = path[-1]
+        if current in destinations:
+            return path, nodes_created
+        if current in explored and explored[current] <= g_cost:
+            continue
+        explored[current] = g_cost
+
+        for neighbor, step_cost in tiled.get(current, {}).items():
+            new_g_cost = g_cost + step_cost
+            if neighbor in explored and explored[neighbor] <= new_g_cost:
+                continue
+            nodes_created += 1
+            h_cost = heuristic(neighbor)
+            frontier.push(new_g_cost + h_cost, neighbor, (new_g_cost, path + [neighbor]), h_cost)
+
+    return None, nodes_created
+
+# --- Benchmark ---
+
+def write_grid_problem(filename, side, seed=0):
+    """Writes a side x side grid map in the problem file format."""
+    import random
+
+    rng = random.Random(seed)
+    with open(filename, 'w') as f:
+        f.write("Nodes:\n")
+        for x in range(side):
+            for y in range(side):
+                f.write(f"{x * side + y + 1}: ({x},{y})\n")
+        f.write("Edges:\n")
+        for x in range(side):
+            for y in range(side):
+                node = x * side + y + 1
+                for nx, ny in ((x + 1, y), (x, y + 1)):
+                    if nx < side and ny < side:
+                        neighbor = nx * side + ny + 1
+                        cost = rng.randint(1, 3)
+                        f.write(f"({node},{neighbor}): {cost}\n({neighbor},{node}): {cost}\n")
+        f.write("Origin:\n1\nDestinations:\n2\n")
+
+def benchmark(side=400, queries=5, span=20, tile_size=DEFAULT_TILE_SIZE):
+    """Time-to-first-result and peak memory of local queries, full load vs tiles."""
+    import random
+    import tempfile
+    import time
+    import tracemalloc
+    from CUS1 import read_problem_file
+
+    rng = random.Random(1)
+    pairs = []
+    for _ in range(queries):
+        x, y = rng.randrange(side - span), rng.randrange(side - span)
+        dx, dy = rng.randrange(span), rng.randrange(span)
+        pairs.append((x * side + y + 1, (x + dx) * side + (y + dy) + 1))
+
+    with tempfile.TemporaryDirectory() as directory:
+        problem = os.path.join(directory, "grid.txt")
+        write_grid_problem(problem, side)
+        print(f"Grid {side}x{side}, {queries} local queries within {span} cells")
+
+        start_time = time.perf_counter()
+        nodes, edges, _, _ = read_problem_file(problem)
+        tile_dir = os.path.join(directory, "tiles")
+        tiles = build_tiles(nodes, edges, tile_dir, tile_size)
+        del nodes, edges
+        print(f"One-off tiling into {tiles} tiles: {time.perf_counter() - start_time:.2f}s")
+
+        for label in ("full", "tiled"):
+            tracemalloc.start()
+            start_time = time.perf_counter()
+            first = None
+            if label == "full":
+                from astar_search import parse_input_file, a_star_search as full_a_star
+                graph = parse_input_file(problem)
+                for origin, dest in pairs:
+                    graph.origin_id, graph.destination_ids = origin, {dest}
+                    full_a_star(graph)
+                    first = first or time.perf_counter() - start_time
+            else:
+                tiled = TiledGraph(tile_dir)
+                for origin, dest in pairs:
+                    a_star_search(tiled, origin, [dest])
+                    first = first or time.perf_counter() - start_time
+            total = time.perf_counter() - start_time
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{label:<6} first result {first:.3f}s  all queries {total:.3f}s  peak {peak / 1024 / 1024:.1f} MiB")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        # python tiled_graph.py <problem file> <output directory> <tile size>
+        from CUS1 import read_problem_file
+        nodes, edges, _, _ = read_problem_file(sys.argv[1])
+        count = build_tiles(nodes, edges, sys.argv[2], int(sys.argv[3]))
+        print(f"Wrote {count} tiles to {sys.argv[2]}")
+    elif len(sys.argv) == 2:
+        benchmark(side=int(sys.argv[1]))
+    else:
+        benchmark()